@@ -1,4 +1,5 @@
-import math
+from collections import deque
+from itertools import accumulate
 
 from .options import (
     BaseSeedOption,
@@ -7,16 +8,21 @@ from .options import (
     NestedSeedOption,
 )
 
-from typing import Any, Generator, Sequence
+from typing import Any, Sequence
 
 
 VERSION_WIDTH = 5
 VERSION_MAX = 2**VERSION_WIDTH - 1
 BYTE_WIDTH = 8
 DIGIT_WIDTH = 5
-DIGIT_MODULO_BLACKLIST = (1, 3, 6)
+DIGIT_MODULO_BLACKLIST = frozenset({1, 3, 6})
 DIGIT_PLACEHOLDERS = "Xx"
 
+_CONTAINER_SEED_OPTIONS = (GroupedSeedOption, NestedSeedOption)
+_TEMPLATE_TRANSLATION = str.maketrans(
+    {"{": "{{", "}": "}}"} | dict.fromkeys(DIGIT_PLACEHOLDERS, "{}")
+)
+
 
 class SeedFormatError(Exception):
     pass
@@ -24,15 +30,20 @@ class SeedFormatError(Exception):
 
 def _flatten_seed_options(
     seed_options: Sequence[BaseSeedOption],
-) -> Generator[ValueSeedOption[Any], None, None]:
-    for child in seed_options:
-        match child:
-            case ValueSeedOption():
-                yield child
-            case GroupedSeedOption() | NestedSeedOption():
-                yield from _flatten_seed_options(child.children)
-            case _:
-                pass
+) -> tuple[tuple[ValueSeedOption[Any], ...], int]:
+    value_seed_options: list[ValueSeedOption[Any]] = []
+    width = 0
+
+    pending = deque(seed_options)
+    while pending:
+        child = pending.popleft()
+        if isinstance(child, ValueSeedOption):
+            value_seed_options.append(child)
+            width += child.width
+        elif isinstance(child, _CONTAINER_SEED_OPTIONS):
+            pending.extendleft(reversed(child.children))
+
+    return tuple(value_seed_options), width
 
 
 class SeedFormat:
@@ -94,6 +105,31 @@ class SeedFormat:
     The ValueSeedOption's that are encoded into seeds of this format.
     """
 
+    _option_layout: tuple[tuple[ValueSeedOption[Any], int, int], ...]
+    """
+    Each of the `value_seed_options`, paired with the position of its lowest
+    bit within a seed's data and a mask covering its width.
+    """
+    _random_offset: int
+    """
+    The position of the lowest bit of the 'random' segment within a seed's
+    data.
+    """
+    _random_mask: int
+    """
+    A mask covering the `random_width` bits of the 'random' segment.
+    """
+    _digit_count: int
+    """
+    The number of base32 digits in seeds of this format, as per the 'X' count
+    in its `format_string`.
+    """
+    _string_template: str
+    """
+    The `format_string` as a `str.format` template, with a replacement field
+    in place of each 'X'.
+    """
+
     byte_count: int
     """
     The quantity of bytes represented in each seed of this seed format,
@@ -133,21 +169,33 @@ class SeedFormat:
         self.version = version
         self.format_string = format_string
         self.seed_options = seed_options
-        self.value_seed_options = tuple(_flatten_seed_options(seed_options))
+        self.value_seed_options, options_width = _flatten_seed_options(
+            seed_options
+        )
+
+        widths = tuple(option.width for option in self.value_seed_options)
 
-        min_width = VERSION_WIDTH + sum(
-            option.width for option in self.value_seed_options
+        min_width = VERSION_WIDTH + options_width
+
+        *bit_offsets, _ = accumulate(reversed(widths), initial=VERSION_WIDTH)
+        self._option_layout = tuple(
+            zip(
+                self.value_seed_options,
+                reversed(bit_offsets),
+                ((1 << width) - 1 for width in widths),
+            )
         )
-        min_bytes = int(math.ceil(min_width / BYTE_WIDTH))
-        min_digits = int(math.ceil(min_bytes * BYTE_WIDTH / DIGIT_WIDTH))
+        self._random_offset = min_width
 
-        digits = 0
-        invalid = ""
-        for char in format_string:
-            if char in DIGIT_PLACEHOLDERS:
-                digits += 1
-            elif char.isalnum() and not char in invalid:
-                invalid += char
+        min_bytes = -(-min_width // BYTE_WIDTH)
+        min_digits = -(-min_bytes * BYTE_WIDTH // DIGIT_WIDTH)
+
+        digits = sum(map(format_string.count, DIGIT_PLACEHOLDERS))
+        invalid = "".join(
+            char
+            for char in dict.fromkeys(format_string)
+            if char.isalnum() and char not in DIGIT_PLACEHOLDERS
+        )
 
         if invalid != "":
             raise SeedFormatError(
@@ -168,8 +216,12 @@ class SeedFormat:
                 f" use {digits - 1} or {digits + 1} instead"
             )
 
-        self.byte_count = int(math.floor(digits * DIGIT_WIDTH / BYTE_WIDTH))
+        self._digit_count = digits
+        self._string_template = format_string.translate(_TEMPLATE_TRANSLATION)
+
+        self.byte_count = digits * DIGIT_WIDTH // BYTE_WIDTH
         self.random_width = self.byte_count * BYTE_WIDTH - min_width
+        self._random_mask = (1 << self.random_width) - 1
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({self.version}, {self.format_string})"
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import math
-
 import mods_base
 
 from typing import Sequence
@@ -34,8 +32,7 @@ class ValueSeedOption[J: mods_base.JSON](
         """
         raise NotImplementedError
 
-    def __hash__(self) -> int:
-        return id(self)
+    __hash__ = object.__hash__  # pyright: ignore[reportAssignmentType]
 
     def __eq__(self, value: object) -> bool:
         return self is value
@@ -52,7 +49,9 @@ class BoolSeedOption(ValueSeedOption[bool], mods_base.BoolOption):
 
 
 class SliderSeedOption(ValueSeedOption[float], mods_base.SliderOption):
-    _range: range
+    _min: int
+    _step: int
+    _count: int
 
     def __post_init__(self) -> None:
         if not self.is_integer:
@@ -64,40 +63,79 @@ class SliderSeedOption(ValueSeedOption[float], mods_base.SliderOption):
                 " of step"
             )
 
-        self._range = range(
-            int(self.min_value), int(self.max_value) + 1, int(self.step)
-        )
+        self._min = int(self.min_value)
+        self._step = int(self.step)
+        self._count = (int(self.max_value) - self._min) // self._step + 1
+        if self._count < 1:
+            raise ValueError(
+                "SliderSeedOption max_value must not be less than min_value"
+            )
 
-        self.width = int(math.ceil(math.log2(len(self._range))))
+        self.width = (self._count - 1).bit_length()
 
         super().__post_init__()
 
     def value_to_bits(self, value: float) -> int:
-        return self._range.index(int(value))
+        bits, remainder = divmod(int(value) - self._min, self._step)
+        if remainder or not 0 <= bits < self._count:
+            raise ValueError(f"{value} is not a valid value for {self}")
+        return bits
 
     def bits_to_value(self, bits: int) -> int:
-        return self._range[bits]
+        if bits >= self._count:
+            raise IndexError(f"{bits} is out of range for {self}")
+        return self._min + bits * self._step
 
 
 class SpinnerSeedOption(ValueSeedOption[str], mods_base.SpinnerOption):
+    _choice_indices: dict[str, int]
+
     def __post_init__(self) -> None:
-        self.width = int(math.ceil(math.log2(len(self.choices))))
+        if not self.choices:
+            raise ValueError(
+                f"{type(self).__name__} choices must not be empty"
+            )
+
+        self._choice_indices = {}
+        for index, choice in enumerate(self.choices):
+            self._choice_indices.setdefault(choice, index)
+        self.width = (len(self.choices) - 1).bit_length()
         super().__post_init__()
 
     def value_to_bits(self, value: str) -> int:
-        return self.choices.index(value)
+        try:
+            return self._choice_indices[value]
+        except KeyError:
+            raise ValueError(
+                f"{value} is not a valid value for {self}"
+            ) from None
 
     def bits_to_value(self, bits: int) -> str:
         return self.choices[bits]
 
 
 class DropdownSeedOption(ValueSeedOption[str], mods_base.DropdownOption):
+    _choice_indices: dict[str, int]
+
     def __post_init__(self) -> None:
-        self.width = int(math.ceil(math.log2(len(self.choices))))
+        if not self.choices:
+            raise ValueError(
+                f"{type(self).__name__} choices must not be empty"
+            )
+
+        self._choice_indices = {}
+        for index, choice in enumerate(self.choices):
+            self._choice_indices.setdefault(choice, index)
+        self.width = (len(self.choices) - 1).bit_length()
         super().__post_init__()
 
     def value_to_bits(self, value: str) -> int:
-        return self.choices.index(value)
+        try:
+            return self._choice_indices[value]
+        except KeyError:
+            raise ValueError(
+                f"{value} is not a valid value for {self}"
+            ) from None
 
     def bits_to_value(self, bits: int) -> str:
         return self.choices[bits]
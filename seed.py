@@ -1,18 +1,36 @@
-from base64 import b32encode, b32decode
+from base64 import b32encode
 import os
 from pathlib import Path
-from random import getrandbits
-from weakref import ReferenceType, WeakValueDictionary
+from string import ascii_lowercase, ascii_uppercase, digits
 
 import mods_base
 
-from .formats import SeedFormat, VERSION_WIDTH, DIGIT_PLACEHOLDERS
+from .formats import (
+    SeedFormat,
+    BYTE_WIDTH,
+    DIGIT_MODULO_BLACKLIST,
+    DIGIT_WIDTH,
+    VERSION_MAX,
+)
 from .options import ValueSeedOption
 from . import ui
 
 from typing import Any, ClassVar, IO, Self, Sequence, overload
 
 
+_B32_ALPHABET = ascii_uppercase + "234567"
+_B32_TRANSLATION = str.maketrans(
+    _B32_ALPHABET + _B32_ALPHABET.lower() + "0189",
+    2 * (digits + ascii_lowercase)[:32] + "!!!!",
+    "".join(char for char in map(chr, range(128)) if not char.isalnum()),
+)
+"""
+Translation table that converts the base32 digits in seed strings into the
+digits of a base 32 `int()` literal, removes ASCII decoration, and replaces
+alphanumerics outside of the base32 alphabet with an invalid digit.
+"""
+
+
 class SeedVersionError(Exception):
     version: int
 
@@ -47,20 +65,23 @@ class seed_type(type):
                 " at least one SeedFormat"
             )
 
-        versions: set[int] = set()
+        seed_formats_by_version: dict[int, SeedFormat] = {}
         for seed_format in seed_formats:
-            if seed_format.version in versions:
+            if seed_format.version in seed_formats_by_version:
                 raise ValueError(
                     f"{name} defines version {seed_format.version} multiple"
                     " times"
                 )
-            versions.add(seed_format.version)
+            seed_formats_by_version[seed_format.version] = seed_format
 
         namespace.setdefault("default_version", seed_formats[-1])
 
-        namespace["_new_seed_menus"] = WeakValueDictionary()
-        namespace["_edit_seed_button"] = lambda: None
-        namespace["_select_seed_menu"] = lambda: None
+        namespace["_seed_formats_by_version"] = seed_formats_by_version
+
+        namespace["_new_seed_menus"] = {}
+        namespace["_edit_seed_button"] = None
+        namespace["_select_seed_menu"] = None
+        namespace["_loaded_seeds"] = None
 
         return super().__new__(cls, name, bases, namespace, **kwds)
 
@@ -124,11 +145,13 @@ class Seed(metaclass=seed_type):
             The IO object for the seeds file.
         """
         try:
-            os.makedirs(cls.seeds_file.parent, exist_ok=True)
-            if not os.path.exists(cls.seeds_file):
-                with open(cls.seeds_file, "w"):
+            try:
+                return open(cls.seeds_file, mode, encoding="utf-8")
+            except FileNotFoundError:
+                os.makedirs(cls.seeds_file.parent, exist_ok=True)
+                with open(cls.seeds_file, "a"):
                     pass
-            return open(cls.seeds_file, mode, encoding="utf-8")
+                return open(cls.seeds_file, mode, encoding="utf-8")
         except OSError as error:
             if show_error:
                 ui.show_message(
@@ -138,6 +161,8 @@ class Seed(metaclass=seed_type):
                 )
             raise error
 
+    _seed_formats_by_version: ClassVar[dict[int, SeedFormat]]
+
     @classmethod
     def seed_format_for_version(
         cls, version: int | SeedFormat | None = None
@@ -164,11 +189,11 @@ class Seed(metaclass=seed_type):
             case None:
                 return cls.default_version
             case int():
-                for seed_format in cls.seed_formats:
-                    if version == seed_format.version:
-                        return seed_format
+                if seed_format := cls._seed_formats_by_version.get(version):
+                    return seed_format
             case SeedFormat():
-                if version in cls.seed_formats:
+                seed_format = cls._seed_formats_by_version.get(version.version)
+                if seed_format is version:
                     return version
                 version = version.version
 
@@ -176,7 +201,7 @@ class Seed(metaclass=seed_type):
             version, f"{cls.__name__} does not define seed version {version}"
         )
 
-    _new_seed_menus: ClassVar[WeakValueDictionary[int, ui.NewSeedNested]]
+    _new_seed_menus: ClassVar[dict[int, ui.NewSeedNested]]
 
     @classmethod
     def new_seed_menu(
@@ -202,7 +227,7 @@ class Seed(metaclass=seed_type):
             cls._new_seed_menus[seed_format.version] = menu
         return menu
 
-    _edit_seed_button: ClassVar[ReferenceType[ui.EditSeedsButton]]
+    _edit_seed_button: ClassVar[ui.EditSeedsButton | None]
 
     @classmethod
     def edit_seeds_button(cls) -> ui.EditSeedsButton:
@@ -211,12 +236,12 @@ class Seed(metaclass=seed_type):
         in their default text editor. You may insert this object anywhere in
         your mod's options.
         """
-        if not (button := cls._edit_seed_button()):
+        if not (button := cls._edit_seed_button):
             button = ui.EditSeedsButton(cls.edit_seeds)
-            cls._edit_seed_button = ReferenceType(button)
+            cls._edit_seed_button = button
         return button
 
-    _select_seed_menu: ClassVar[ReferenceType[ui.SelectSeedNested]]
+    _select_seed_menu: ClassVar[ui.SelectSeedNested | None]
 
     @classmethod
     def select_seed_menu(cls) -> ui.SelectSeedNested:
@@ -225,9 +250,9 @@ class Seed(metaclass=seed_type):
         may insert this object anywhere in your mod's options - doing so also
         stores the user's last selected seed in your mod's options.
         """
-        if not (menu := cls._select_seed_menu()):
-            menu = ui.SelectSeedNested(cls.load_seeds, cls._seed_selected)
-            cls._select_seed_menu = ReferenceType(menu)
+        if not (menu := cls._select_seed_menu):
+            menu = ui.SelectSeedNested(cls._load_seeds, cls._seed_selected)
+            cls._select_seed_menu = menu
         return menu
 
     @classmethod
@@ -236,17 +261,16 @@ class Seed(metaclass=seed_type):
     ) -> None:
         seed = cls.new_seed_generated(seed_format, options)
 
-        with cls.open_seeds_file("a+") as file:
-            file.seek(0, 0)
+        with cls.open_seeds_file() as file:
             seeds = file.read()
 
-            if len(seeds) > 0 and seeds[-1] not in "\n\r":
-                file.write("\n")
-
-            if seed.string not in seeds:
+        if seed.string not in map(str.strip, seeds.splitlines()):
+            with cls.open_seeds_file("a") as file:
+                if len(seeds) > 0 and seeds[-1] not in "\n\r":
+                    file.write("\n")
                 file.write(seed.string + "\n")
 
-        if menu := cls._select_seed_menu():
+        if menu := cls._select_seed_menu:
             menu._seedsystem_dropdown.seedsystem_commit_staged(seed.string)
 
         cls.enable_seed(seed)
@@ -291,9 +315,13 @@ class Seed(metaclass=seed_type):
         """
         Called when the list of seeds is loaded from the seeds file to be shown
         in the seed selection menu. The seeds file is simply parsed into lines
-        stripped of whitespace, and therefor entries are not guaranteed to be
-        valid seeds (validation is performed when the user ultimately selects
-        an entry).
+        stripped of whitespace, omitting blank lines, and therefor entries are
+        not guaranteed to be valid seeds (validation is performed when the
+        user ultimately selects an entry).
+
+        Unless this method is overridden, the seed selection menu only reads
+        the seeds file again once it has been modified since it was last
+        loaded, reusing the previous list otherwise.
 
         You may override this method if you would like to customize the list
         of items presented to the user in the seed selection menu.
@@ -302,7 +330,27 @@ class Seed(metaclass=seed_type):
             The list of strings representing the entries in the seeds file.
         """
         with cls.open_seeds_file() as file:
-            return [line.strip() for line in file]
+            return list(filter(None, map(str.strip, file.read().splitlines())))
+
+    _loaded_seeds: ClassVar[tuple[tuple[int, int], list[str]] | None]
+
+    @classmethod
+    def _load_seeds(cls) -> list[str]:
+        if cls.load_seeds.__func__ is not Seed.load_seeds.__func__:
+            return cls.load_seeds()
+
+        try:
+            stat = cls.seeds_file.stat()
+            file_state = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return cls.load_seeds()
+
+        if cls._loaded_seeds and cls._loaded_seeds[0] == file_state:
+            return cls._loaded_seeds[1]
+
+        seeds = cls.load_seeds()
+        cls._loaded_seeds = file_state, seeds
+        return seeds
 
     @classmethod
     def _seed_selected(cls, string: str) -> None:
@@ -315,10 +363,10 @@ class Seed(metaclass=seed_type):
                 " install a version of that supports seeds of version"
                 f" {error.version}",
             )
-            raise error
+            raise ui.SeedApplyError(string) from error
         except Exception as error:
             ui.show_message("Invalid Seed", f"Seed '{string}' is not valid.")
-            raise error
+            raise ui.SeedApplyError(string) from error
 
         cls.enable_seed(seed)
 
@@ -372,7 +420,7 @@ class Seed(metaclass=seed_type):
                 settings via `select_seed_menu()`.
         """
         if not seed:
-            if not (menu := cls._select_seed_menu()):
+            if not (menu := cls._select_seed_menu):
                 raise RuntimeError(
                     "Invoking enable_seed() with no arguments to enable the"
                     " seed stored in settings requires select_seed_menu() be"
@@ -384,6 +432,9 @@ class Seed(metaclass=seed_type):
             if not seed_string:
                 return
 
+            if cls.current_seed and cls.current_seed.string == seed_string:
+                return
+
             try:
                 seed = cls(seed_string)
             except Exception as error:
@@ -394,7 +445,7 @@ class Seed(metaclass=seed_type):
                 return
 
         if cls.current_seed:
-            if seed == cls.current_seed:
+            if seed is cls.current_seed or seed == cls.current_seed:
                 return
 
             cls.current_seed.disable()
@@ -412,6 +463,8 @@ class Seed(metaclass=seed_type):
             cls.current_seed.disable()
             cls.current_seed = None
 
+    __slots__ = ("string", "data", "seed_format", "options")
+
     string: str
     """
     The string representation of this seed, as the user sees it.
@@ -532,64 +585,83 @@ class Seed(metaclass=seed_type):
                 provided. `ValueError` is raised for Any options provided that
                 are not present in the seed format.
         """
-        self.options = dict()
-
         if string is not None:
-            b32 = "".join(char.upper() for char in string if char.isalnum())
-            if len(b32) % 8:
-                b32 += "=" * (8 - len(b32) % 8)
+            b32 = string.translate(_B32_TRANSLATION)
+            if not b32.isascii():
+                b32 = "".join(char for char in b32 if char.isalnum())
+                if not b32.isascii():
+                    raise ValueError(
+                        f"Seed '{string}' contains invalid digits"
+                    )
+
+            if len(b32) % 8 in DIGIT_MODULO_BLACKLIST:
+                raise ValueError(f"Seed '{string}' has an invalid length")
+
+            try:
+                bits = int(b32, 32)
+            except ValueError:
+                raise ValueError(
+                    f"Seed '{string}' contains invalid digits"
+                ) from None
+            bits >>= len(b32) * DIGIT_WIDTH % BYTE_WIDTH
 
-            self.data = b32decode(b32)
-            bits = int.from_bytes(self.data, "big")
+            version = bits & VERSION_MAX
 
-            version = bits & (2**VERSION_WIDTH - 1)
-            bits >>= VERSION_WIDTH
+            seed_format = type(self).seed_format_for_version(version)
+            if len(b32) != seed_format._digit_count:
+                raise ValueError(
+                    f"Seed '{string}' is not the correct length for version"
+                    f" {version}"
+                )
 
-            self.seed_format = type(self).seed_format_for_version(version)
-            for option in reversed(self.seed_format.value_seed_options):
-                value_bits = bits & (2**option.width - 1)
-                self.options[option] = option.bits_to_value(value_bits)
-                bits >>= option.width
+            self.seed_format = seed_format
+            self.data = bits.to_bytes(seed_format.byte_count, "big")
+            self.options = {
+                option: option.bits_to_value((bits >> offset) & mask)
+                for option, offset, mask in seed_format._option_layout
+            }
 
         else:
-            self.seed_format = type(self).seed_format_for_version(version)
+            seed_format = type(self).seed_format_for_version(version)
 
             if random is None:
-                bits = getrandbits(self.seed_format.random_width)
+                random_width = seed_format.random_width
+                random_bytes = os.urandom(-(-random_width // BYTE_WIDTH))
+                bits = int.from_bytes(random_bytes, "big") >> (
+                    -random_width % BYTE_WIDTH
+                )
             else:
-                bits = random & (self.seed_format.random_width**2 - 1)
+                bits = random & seed_format._random_mask
+
+            bits <<= seed_format._random_offset
+            bits |= seed_format.version
 
-            for option in self.seed_format.value_seed_options:
+            values: dict[ValueSeedOption[Any], Any] = dict()
+            for option, offset, _ in seed_format._option_layout:
                 value = options.get(option, option.default_value)
-                self.options[option] = value
-                bits = (bits << option.width) | option.value_to_bits(value)
+                values[option] = value
+                bits |= option.value_to_bits(value) << offset
 
-            invalid = options.keys() - self.options.keys()
+            invalid = options.keys() - values.keys()
             if len(invalid):
                 raise ValueError(
-                    f"{self.seed_format} does not support options {invalid}"
+                    f"{seed_format} does not support options {invalid}"
                 )
 
-            bits = (bits << VERSION_WIDTH) | self.seed_format.version
+            self.seed_format = seed_format
+            self.data = bits.to_bytes(seed_format.byte_count, "big")
+            self.options = values
 
-            self.data = bits.to_bytes(self.seed_format.byte_count, "big")
-
-        b32 = b32encode(self.data).decode("ascii").strip("=")
-        b32_index = 0
-
-        self.string = ""
-        for char in self.seed_format.format_string:
-            if char in DIGIT_PLACEHOLDERS:
-                self.string += b32[b32_index].lower()
-                b32_index += 1
-            else:
-                self.string += char
+        b32 = b32encode(self.data)[: seed_format._digit_count]
+        self.string = seed_format._string_template.format(
+            *b32.lower().decode("ascii")
+        )
 
     def __hash__(self) -> int:
         return hash(self.data)
 
     def __eq__(self, value: object) -> bool:
-        return type(value) == type(self) and self.data == value.data
+        return type(value) is type(self) and self.data == value.data
 
     def __getitem__[T: mods_base.JSON](self, option: ValueSeedOption[T]) -> T:
         try:
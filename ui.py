@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from weakref import ReferenceType
+from functools import cache
 
 import mods_base
 
@@ -12,7 +12,7 @@ except ImportError:
 from .formats import SeedFormat
 from .options import ValueSeedOption
 
-from typing import Any, Callable, Self
+from typing import Any, Callable
 
 
 type GenerateSeedCallback = Callable[
@@ -23,21 +23,44 @@ type LoadSeedsCallback = Callable[[], list[str]]
 type ApplySeedCallback = Callable[[str], None]
 
 
-def show_message(title: str, message: str) -> None:
-    if console_screens:
-        print(f"\n[ {title} ]\n{message}\n")
+class SeedApplyError(Exception):
+    """
+    Raised by an `ApplySeedCallback` when the selected seed could not be
+    applied, after the user has been informed of the reason.
+    """
 
-    elif mods_base.Game.get_tree() == mods_base.Game.Willow2:
+
+@cache
+def _game_message_function() -> Callable[[str, str], None] | None:
+    game = mods_base.Game.get_tree()
+
+    if game == mods_base.Game.Willow2:
         from ui_utils.training_box import TrainingBox
 
-        TrainingBox(title=title, message=message).show()
+        def show_training_box(title: str, message: str) -> None:
+            TrainingBox(title=title, message=message).show()
+
+        return show_training_box
 
-    elif mods_base.Game.get_tree() == mods_base.Game.Oak:
+    if game == mods_base.Game.Oak:
         from ui_utils.tutorial_message import show_modal_tutorial_message  # type: ignore
 
-        show_modal_tutorial_message(
-            title=title, msg=message, image_name="TrueVaultHunter"
-        )
+        def show_tutorial_message(title: str, message: str) -> None:
+            show_modal_tutorial_message(
+                title=title, msg=message, image_name="TrueVaultHunter"
+            )
+
+        return show_tutorial_message
+
+    return None
+
+
+def show_message(title: str, message: str) -> None:
+    if console_screens:
+        print(f"\n[ {title} ]\n{message}\n")
+
+    elif game_message_function := _game_message_function():
+        game_message_function(title, message)
 
 
 class NewSeedNested(mods_base.NestedOption):
@@ -77,17 +100,10 @@ class NewSeedNested(mods_base.NestedOption):
         self._seedsystem_seed_format = seed_format
         self._seedsystem_on_generate = on_generate
 
-        def on_press(
-            button: mods_base.ButtonOption,
-            menu_ref: ReferenceType[Self] = ReferenceType(self),
-        ):
-            if menu := menu_ref():
-                menu.generate_pressed()
-
         self._seedsystem_generate_button = mods_base.ButtonOption(
             identifier="GENERATE SEED",
             description="Confirm selections and generate the new seed.",
-            on_press=on_press,
+            on_press=lambda _: self.generate_pressed(),
         )
 
         super().__init__(
@@ -100,11 +116,13 @@ class NewSeedNested(mods_base.NestedOption):
         )
 
     def generate_pressed(self) -> None:
-        options: dict[ValueSeedOption[Any], Any] = dict()
-        for seed_option in self._seedsystem_seed_format.value_seed_options:
-            options[seed_option] = seed_option.value
+        seed_format = self._seedsystem_seed_format
+        options: dict[ValueSeedOption[Any], Any] = {
+            seed_option: seed_option.value
+            for seed_option in seed_format.value_seed_options
+        }
 
-        self._seedsystem_on_generate(self._seedsystem_seed_format, options)
+        self._seedsystem_on_generate(seed_format, options)
 
 
 class EditSeedsButton(mods_base.ButtonOption):
@@ -128,6 +146,9 @@ class SelectSeedNested(mods_base.NestedOption):
 
     _seedsystem_children: list[mods_base.BaseOption]
 
+    _seedsystem_seeds: list[str] | None = None
+    _seedsystem_padded_seeds: list[str]
+
     @property
     def apply_button_display_name(self) -> str:
         return self._seedsystem_apply_button.display_name
@@ -185,20 +206,13 @@ class SelectSeedNested(mods_base.NestedOption):
         self._seedsystem_on_apply = on_apply
         self._seedsystem_dropdown = SeedDropdown(on_load(), on_apply)
 
-        def on_press(
-            button: mods_base.ButtonOption,
-            menu_ref: ReferenceType[Self] = ReferenceType(self),
-        ) -> None:
-            if menu := menu_ref():
-                menu.apply_pressed()
-
         self._seedsystem_apply_button = mods_base.ButtonOption(
             identifier="APPLY SEED",
             description=(
                 "Confirm selection of the above seed and apply it to your"
                 " game."
             ),
-            on_press=on_press,
+            on_press=lambda _: self.apply_pressed(),
         )
 
         super().__init__(
@@ -215,9 +229,15 @@ class SelectSeedNested(mods_base.NestedOption):
         seeds = self._seedsystem_on_load()
 
         if self._seedsystem_dropdown.value in seeds:
-            self._seedsystem_dropdown.choices = seeds
+            choices = seeds
         else:
-            self._seedsystem_dropdown.choices = [""] + seeds
+            if seeds != self._seedsystem_seeds:
+                self._seedsystem_seeds = seeds.copy()
+                self._seedsystem_padded_seeds = [""] + seeds
+            choices = self._seedsystem_padded_seeds
+
+        if self._seedsystem_dropdown.choices is not choices:
+            self._seedsystem_dropdown.choices = choices
 
         self._seedsystem_apply_button.is_hidden = bool(console_screens)
 
@@ -235,12 +255,13 @@ class SelectSeedNested(mods_base.NestedOption):
                 self._seedsystem_dropdown._seedsystem_staged
             )
             self._seedsystem_dropdown.seedsystem_commit_staged()
-        except Exception:
+        except SeedApplyError:
             pass
 
 
 class SeedDropdown(mods_base.DropdownOption):
     _seedsystem_value: str | None = None
+    _seedsystem_saved: str | None = None
     _seedsystem_staged: str
     _seedsystem_on_apply: ApplySeedCallback
 
@@ -270,7 +291,7 @@ class SeedDropdown(mods_base.DropdownOption):
             try:
                 self._seedsystem_on_apply(value)
                 self._seedsystem_value = value
-            except Exception:
+            except SeedApplyError:
                 pass
 
         elif self._seedsystem_value is None and value != "":
@@ -278,10 +299,14 @@ class SeedDropdown(mods_base.DropdownOption):
 
     def seedsystem_commit_staged(self, value: str | None = None) -> None:
         if value is None:
-            self._seedsystem_value = self._seedsystem_staged
+            value = self._seedsystem_staged
         else:
-            self._seedsystem_value = value
             self._seedsystem_staged = value
 
+        if value == self._seedsystem_value == self._seedsystem_saved:
+            return
+
+        self._seedsystem_value = value
+        self._seedsystem_saved = value
         if self.mod:
             self.mod.save_settings()